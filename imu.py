@@ -7,7 +7,7 @@ WebSocket sends: {imu: {pitch, roll, yaw, heading}, gnss: {lat, lon, alt}, targe
 
 import asyncio
 import websockets
-import json
+import orjson
 import logging
 import board
 import busio
@@ -16,8 +16,19 @@ from adafruit_bno08x.i2c import BNO08X_I2C
 import serial
 import serial.tools.list_ports
 import math
-from collections import deque
+import re
+import threading
 import time
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba not installed - run the pipeline as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
 
 # Configure logging
 logging.basicConfig(
@@ -26,42 +37,162 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Default moving average window (samples)
+SMOOTHING_WINDOW = 5
+
+# Rotation vector report interval (s): adafruit_bno08x enables reports at
+# its default 50ms (20 Hz) rate
+IMU_REPORT_INTERVAL = 0.05
+
+# Per-client send budget within the 50ms broadcast tick (seconds), and the
+# queued bytes above which a client is considered backed up
+SEND_TIMEOUT = 0.04
+MAX_WRITE_BUFFER = 4096
+
+# NMEA GGA sentence: lat ddmm.mmmm, N/S, lon dddmm.mmmm, E/W, ..., altitude
+_GGA = re.compile(
+    rb'^\$G[PN]GGA,[^,]*,(\d{2})(\d+\.\d+),([NS]),(\d{3})(\d+\.\d+),([EW]),'
+    rb'[^,]*,[^,]*,[^,]*,(-?\d+\.\d+)'
+)
+
+
+@njit(cache=True, fastmath=True)
+def _wrap_angle(angle):
+    """Normalize angle to -180 to 180 degrees"""
+    # Same result as math.remainder(angle, 360.0), in a form Numba compiles
+    return angle - 360.0 * np.rint(angle / 360.0)
+
+
+def quaternion_to_euler(q):
+    """
+    Offline batch conversion of quaternions to Euler angles in degrees
+    q: array of shape (N, 4) with columns w, x, y, z
+    Returns: (roll, pitch, yaw) arrays of shape (N,), all in degrees
+    """
+    q = np.asarray(q, dtype=np.float64)
+    w, x, y, z = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+    
+    # Roll (x-axis rotation) - side to side tilt
+    roll = np.arctan2(2 * (w * x + y * z), 1 - 2 * (x * x + y * y))
+    
+    # Pitch (y-axis rotation) - forward/backward tilt, clipped at ±90°
+    pitch = np.arcsin(np.clip(2 * (w * y - z * x), -1.0, 1.0))
+    
+    # Yaw (z-axis rotation) - compass direction
+    yaw = np.arctan2(2 * (w * z + x * y), 1 - 2 * (y * y + z * z))
+    
+    return np.degrees(roll), np.degrees(pitch), np.degrees(yaw)
+
+
+def moving_average(series, window=SMOOTHING_WINDOW):
+    """
+    Offline moving average of a whole series via cumulative sums
+    O(len(series)) regardless of window size
+    Returns: array of len(series) - window + 1 averages
+    """
+    series = np.asarray(series, dtype=np.float64)
+    if window < 1:
+        raise ValueError(f"window must be >= 1, got {window}")
+    if window > len(series):
+        raise ValueError(f"window ({window}) is longer than the series ({len(series)})")
+    
+    csum = np.cumsum(np.insert(series, 0, 0.0))
+    return (csum[window:] - csum[:-window]) / window
+
+
+@njit(cache=True, fastmath=True)
+def _smooth(buf_roll, buf_pitch, buf_yaw, sums, idx, count, roll, pitch, yaw):
+    """
+    O(1) moving average: replace the sample at idx and update the running
+    sums (roll, pitch, yaw) by new - old instead of re-summing the buffers.
+    count is the number of filled slots including the new sample.
+    Returns: (roll, pitch, yaw) averages
+    """
+    sums[0] += roll - buf_roll[idx]
+    sums[1] += pitch - buf_pitch[idx]
+    sums[2] += yaw - buf_yaw[idx]
+    buf_roll[idx] = roll
+    buf_pitch[idx] = pitch
+    buf_yaw[idx] = yaw
+    return sums[0] / count, sums[1] / count, sums[2] / count
+
+
+@njit(cache=True, fastmath=True)
+def _process(qw, qx, qy, qz, buf_roll, buf_pitch, buf_yaw, sums, idx, count,
+             off_r, off_p, off_y):
+    """
+    Hot orientation pipeline: quaternion → euler → smoothing → offset → normalize
+    Smoothing state is updated in place, see _smooth.
+    Returns: (pitch, roll, yaw, heading) all in degrees
+    """
+    # Quaternion to euler angles
+    roll = math.atan2(2.0 * (qw * qx + qy * qz), 1.0 - 2.0 * (qx * qx + qy * qy))
+    sinp = 2.0 * (qw * qy - qz * qx)
+    if sinp > 1.0:
+        sinp = 1.0
+    elif sinp < -1.0:
+        sinp = -1.0
+    pitch = math.asin(sinp)
+    yaw = math.atan2(2.0 * (qw * qz + qx * qy), 1.0 - 2.0 * (qy * qy + qz * qz))
+    
+    # Moving average filter
+    roll, pitch, yaw = _smooth(
+        buf_roll, buf_pitch, buf_yaw, sums, idx, count,
+        math.degrees(roll), math.degrees(pitch), math.degrees(yaw)
+    )
+    
+    # Apply offsets from SET command and normalize to -180 to 180 range
+    roll = _wrap_angle(roll - off_r)
+    pitch = _wrap_angle(pitch - off_p)
+    yaw = _wrap_angle(yaw - off_y)
+    
+    # Heading (0-360 degrees, North=0)
+    heading = (yaw + 360.0) % 360.0
+    
+    return pitch, roll, yaw, heading
+
 
 class BNO085Sensor:
     """Handle BNO085 IMU sensor via I2C"""
     
-    def __init__(self):
+    def __init__(self, window=SMOOTHING_WINDOW):
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        
         self.bno = None
         self.offset_pitch = 0.0
         self.offset_roll = 0.0
         self.offset_yaw = 0.0
         self.initialized = False
         
-        # Moving average filters
-        self.pitch_buffer = deque(maxlen=5)
-        self.roll_buffer = deque(maxlen=5)
-        self.yaw_buffer = deque(maxlen=5)
+        # Moving average filters (ring buffers with running sums, O(1)
+        # per sample for any window size)
+        self.window = window
+        self.roll_buffer = np.zeros(window, dtype=np.float64)
+        self.pitch_buffer = np.zeros(window, dtype=np.float64)
+        self.yaw_buffer = np.zeros(window, dtype=np.float64)
+        self.buffer_sums = np.zeros(3, dtype=np.float64)
+        self.buffer_idx = 0
+        self.buffer_count = 0
         
-        # Current values
+        # Current values (written by the IMU worker thread)
         self.current_pitch = 0.0
         self.current_roll = 0.0
         self.current_yaw = 0.0
         self.current_heading = 0.0
+        self.lock = threading.Lock()
+        self.running = False
         
     def initialize(self):
         """Initialize I2C connection to BNO085"""
         try:
+            # On the Pi the bus clock comes from the device tree, not from
+            # busio (which ignores frequency there). The BNO085 supports
+            # Fast-Mode Plus: set dtparam=i2c_arm_baudrate=1000000 in
+            # /boot/firmware/config.txt for 1 MHz, and verify with i2cdetect.
             logger.info("Initializing I2C for BNO085...")
-            i2c = busio.I2C(board.SCL, board.SDA, frequency=400000)
-            
-            logger.info("Creating BNO08X object...")
-            # Try default address 0x4A first, then 0x4B
-            try:
-                self.bno = BNO08X_I2C(i2c, address=0x4A)
-                logger.info("BNO085 found at address 0x4A")
-            except:
-                self.bno = BNO08X_I2C(i2c, address=0x4B)
-                logger.info("BNO085 found at address 0x4B")
+            i2c = busio.I2C(board.SCL, board.SDA, frequency=1000000)
+            self.bno = self.create_bno(i2c)
             
             logger.info("Enabling rotation vector reports...")
             self.bno.enable_feature(BNO_REPORT_ROTATION_VECTOR)
@@ -71,6 +202,21 @@ class BNO085Sensor:
             
             self.initialized = True
             logger.info("✓ BNO085 initialized successfully on I2C")
+            
+            # Compile _process now, before the worker holds the lock on its
+            # first call (a cold Numba compile takes seconds on the Pi and
+            # would stall read_orientation/set_zero on the event loop)
+            logger.info("Compiling orientation pipeline...")
+            _process(
+                1.0, 0.0, 0.0, 0.0,
+                np.zeros(self.window), np.zeros(self.window), np.zeros(self.window),
+                np.zeros(3), 0, 1,
+                0.0, 0.0, 0.0
+            )
+            
+            # Poll the sensor off the event loop so I2C never blocks broadcasts
+            self.running = True
+            threading.Thread(target=self._imu_worker, daemon=True).start()
             return True
             
         except Exception as e:
@@ -83,118 +229,74 @@ class BNO085Sensor:
             logger.error("Run: sudo i2cdetect -y 1")
             return False
     
-    def quaternion_to_euler(self, qw, qx, qy, qz):
-        """
-        Convert quaternion to Euler angles (roll, pitch, yaw) in degrees
-        Returns: (roll, pitch, yaw) all in degrees
-        """
-        
-        # Roll (x-axis rotation) - side to side tilt
-        sinr_cosp = 2 * (qw * qx + qy * qz)
-        cosr_cosp = 1 - 2 * (qx * qx + qy * qy)
-        roll = math.atan2(sinr_cosp, cosr_cosp)
-        
-        # Pitch (y-axis rotation) - forward/backward tilt
-        sinp = 2 * (qw * qy - qz * qx)
-        if abs(sinp) >= 1:
-            pitch = math.copysign(math.pi / 2, sinp)
-        else:
-            pitch = math.asin(sinp)
-        
-        # Yaw (z-axis rotation) - compass direction
-        siny_cosp = 2 * (qw * qz + qx * qy)
-        cosy_cosp = 1 - 2 * (qy * qy + qz * qz)
-        yaw = math.atan2(siny_cosp, cosy_cosp)
-        
-        # Convert radians to degrees
-        roll = math.degrees(roll)
-        pitch = math.degrees(pitch)
-        yaw = math.degrees(yaw)
-        
-        return roll, pitch, yaw
-    
-    def apply_smoothing(self, roll, pitch, yaw):
-        """Apply moving average filter to reduce noise"""
-        self.roll_buffer.append(roll)
-        self.pitch_buffer.append(pitch)
-        self.yaw_buffer.append(yaw)
-        
-        avg_roll = sum(self.roll_buffer) / len(self.roll_buffer)
-        avg_pitch = sum(self.pitch_buffer) / len(self.pitch_buffer)
-        avg_yaw = sum(self.yaw_buffer) / len(self.yaw_buffer)
-        
-        return avg_roll, avg_pitch, avg_yaw
+    def create_bno(self, i2c):
+        """Create BNO08X object, trying default address 0x4A first, then 0x4B"""
+        logger.info("Creating BNO08X object...")
+        try:
+            bno = BNO08X_I2C(i2c, address=0x4A)
+            logger.info("BNO085 found at address 0x4A")
+        except:
+            bno = BNO08X_I2C(i2c, address=0x4B)
+            logger.info("BNO085 found at address 0x4B")
+        return bno
     
     def normalize_angle(self, angle):
         """Normalize angle to -180 to 180 degrees"""
-        while angle > 180:
-            angle -= 360
-        while angle < -180:
-            angle += 360
-        return angle
+        return math.remainder(angle, 360.0)
     
-    def read_orientation(self):
+    def _imu_worker(self):
         """
-        Read orientation from BNO085
-        Returns dict with: pitch, roll, yaw, heading (all in degrees)
+        Background thread: poll the BNO085 at twice its report rate and
+        publish the processed orientation for read_orientation
+        Only new reports enter the filter, so each smoothing slot holds a
+        distinct sample rather than the same cached report repeated.
         """
-        if not self.initialized or not self.bno:
-            return {
-                'pitch': self.current_pitch,
-                'roll': self.current_roll,
-                'yaw': self.current_yaw,
-                'heading': self.current_heading
-            }
-        
-        try:
-            # Get quaternion from rotation vector
-            quat_i, quat_j, quat_k, quat_real = self.bno.quaternion
+        last_quat = None
+        while self.running:
+            try:
+                # Get quaternion from rotation vector (last cached report)
+                quat = self.bno.quaternion
+                quat_i, quat_j, quat_k, quat_real = quat
+                
+                # Check if valid, new data received
+                if quat_real is not None and quat != last_quat:
+                    last_quat = quat
+                    self.update_orientation(quat_real, quat_i, quat_j, quat_k)
+                    
+            except Exception as e:
+                logger.error(f"Error reading BNO085: {e}")
+                time.sleep(0.1)
             
-            # Check if valid data received
-            if quat_real is None:
-                return {
-                    'pitch': self.current_pitch,
-                    'roll': self.current_roll,
-                    'yaw': self.current_yaw,
-                    'heading': self.current_heading
-                }
+            time.sleep(IMU_REPORT_INTERVAL / 2)
+    
+    def update_orientation(self, qw, qx, qy, qz):
+        """Process one quaternion sample and publish the result"""
+        with self.lock:
+            # Claim the next ring buffer slot
+            idx = self.buffer_idx
+            self.buffer_idx = (idx + 1) % self.window
+            self.buffer_count = min(self.buffer_count + 1, self.window)
             
-            # Convert quaternion to euler angles
-            roll, pitch, yaw = self.quaternion_to_euler(
-                quat_real, quat_i, quat_j, quat_k
+            # Convert, smooth, offset and normalize in one compiled call
+            pitch, roll, yaw, heading = _process(
+                qw, qx, qy, qz,
+                self.roll_buffer, self.pitch_buffer, self.yaw_buffer,
+                self.buffer_sums, idx, self.buffer_count,
+                self.offset_roll, self.offset_pitch, self.offset_yaw
             )
             
-            # Apply smoothing filter
-            roll, pitch, yaw = self.apply_smoothing(roll, pitch, yaw)
-            
-            # Apply offsets from SET command
-            roll -= self.offset_roll
-            pitch -= self.offset_pitch
-            yaw -= self.offset_yaw
-            
-            # Normalize to -180 to 180 range
-            roll = self.normalize_angle(roll)
-            pitch = self.normalize_angle(pitch)
-            yaw = self.normalize_angle(yaw)
-            
-            # Calculate heading (0-360 degrees, North=0)
-            heading = (yaw + 360) % 360
-            
-            # Store current values
-            self.current_pitch = round(pitch, 3)
-            self.current_roll = round(roll, 3)
-            self.current_yaw = round(yaw, 3)
-            self.current_heading = round(heading, 3)
-            
-            return {
-                'pitch': self.current_pitch,
-                'roll': self.current_roll,
-                'yaw': self.current_yaw,
-                'heading': self.current_heading
-            }
-            
-        except Exception as e:
-            logger.error(f"Error reading BNO085: {e}")
+            # Store current values (unrounded, rounding happens once per broadcast)
+            self.current_pitch = pitch
+            self.current_roll = roll
+            self.current_yaw = yaw
+            self.current_heading = heading
+    
+    def read_orientation(self):
+        """
+        Latest orientation published by the IMU worker thread (non-blocking)
+        Returns dict with: pitch, roll, yaw, heading (all in degrees)
+        """
+        with self.lock:
             return {
                 'pitch': self.current_pitch,
                 'roll': self.current_roll,
@@ -207,37 +309,28 @@ class BNO085Sensor:
         Set current position as zero reference point
         All future readings will be relative to this position
         """
-        try:
-            # Read current orientation
-            quat_i, quat_j, quat_k, quat_real = self.bno.quaternion
+        if not self.initialized:
+            logger.error("Error setting zero: BNO085 not initialized")
+            return False
+        
+        with self.lock:
+            # Current values are relative to the old zero, so shift the
+            # offsets by them to make the current position the new zero
+            self.offset_roll = self.normalize_angle(self.offset_roll + self.current_roll)
+            self.offset_pitch = self.normalize_angle(self.offset_pitch + self.current_pitch)
+            self.offset_yaw = self.normalize_angle(self.offset_yaw + self.current_yaw)
             
-            if quat_real is not None:
-                roll, pitch, yaw = self.quaternion_to_euler(
-                    quat_real, quat_i, quat_j, quat_k
-                )
-                
-                # Apply smoothing
-                roll, pitch, yaw = self.apply_smoothing(roll, pitch, yaw)
-                
-                # Set current position as new zero
-                self.offset_roll = roll
-                self.offset_pitch = pitch
-                self.offset_yaw = yaw
-                
-                # Reset current values to zero
-                self.current_pitch = 0.0
-                self.current_roll = 0.0
-                self.current_yaw = 0.0
-                self.current_heading = 0.0
-                
-                logger.info(f"✓ ZERO SET: Roll={roll:.2f}°, Pitch={pitch:.2f}°, Yaw={yaw:.2f}°")
-                logger.info("All IMU values reset to 0° reference")
-                return True
-                
-        except Exception as e:
-            logger.error(f"Error setting zero: {e}")
+            # Reset current values to zero
+            self.current_pitch = 0.0
+            self.current_roll = 0.0
+            self.current_yaw = 0.0
+            self.current_heading = 0.0
+            
+            roll, pitch, yaw = self.offset_roll, self.offset_pitch, self.offset_yaw
         
-        return False
+        logger.info(f"✓ ZERO SET: Roll={roll:.2f}°, Pitch={pitch:.2f}°, Yaw={yaw:.2f}°")
+        logger.info("All IMU values reset to 0° reference")
+        return True
 
 
 class GNSSReader:
@@ -248,6 +341,11 @@ class GNSSReader:
         self.port = None
         self.last_data = {'latitude': 0.0, 'longitude': 0.0, 'altitude': 0.0}
         
+        # Fixed receive buffer, reused for every read (no per-line allocations)
+        self.rxbuf = bytearray(4096)
+        self.rxview = memoryview(self.rxbuf)
+        self.rxlen = 0  # Bytes held, ending in a partial sentence
+        
     def find_gnss_port(self):
         """Auto-detect GNSS USB port"""
         ports = serial.tools.list_ports.comports()
@@ -290,49 +388,64 @@ class GNSSReader:
             return False
     
     def parse_nmea(self, line):
-        """Parse NMEA sentence for GPS data"""
-        try:
-            if line.startswith('$GPGGA') or line.startswith('$GNGGA'):
-                parts = line.split(',')
-                if len(parts) >= 10:
-                    # Latitude
-                    if parts[2] and parts[3]:
-                        lat_deg = float(parts[2][:2])
-                        lat_min = float(parts[2][2:])
-                        lat = lat_deg + (lat_min / 60.0)
-                        if parts[3] == 'S':
-                            lat = -lat
-                        self.last_data['latitude'] = round(lat, 6)
-                    
-                    # Longitude
-                    if parts[4] and parts[5]:
-                        lon_deg = float(parts[4][:3])
-                        lon_min = float(parts[4][3:])
-                        lon = lon_deg + (lon_min / 60.0)
-                        if parts[5] == 'W':
-                            lon = -lon
-                        self.last_data['longitude'] = round(lon, 6)
-                    
-                    # Altitude
-                    if parts[9]:
-                        self.last_data['altitude'] = round(float(parts[9]), 2)
-                    
-                    return True
-                    
-        except Exception as e:
-            pass
+        """Parse raw NMEA sentence bytes (or a memoryview of them) for GPS data"""
+        m = _GGA.match(line)
+        if not m:
+            return False
+        
+        lat_deg, lat_min, lat_hem, lon_deg, lon_min, lon_hem, alt = m.groups()
+        
+        # Latitude
+        lat = float(lat_deg) + float(lat_min) / 60.0
+        if lat_hem == b'S':
+            lat = -lat
+        self.last_data['latitude'] = round(lat, 6)
+        
+        # Longitude
+        lon = float(lon_deg) + float(lon_min) / 60.0
+        if lon_hem == b'W':
+            lon = -lon
+        self.last_data['longitude'] = round(lon, 6)
         
-        return False
+        # Altitude
+        self.last_data['altitude'] = round(float(alt), 2)
+        
+        return True
     
     def read_gnss(self):
-        """Read GNSS data from serial port"""
+        """
+        Read GNSS data from serial port
+        Drains everything buffered in one read and parses only the newest
+        GGA sentence, so stale fixes never queue up behind the broadcast.
+        """
         if not self.serial or not self.serial.is_open:
             return self.last_data
         
         try:
-            if self.serial.in_waiting > 0:
-                line = self.serial.readline().decode('ascii', errors='ignore').strip()
-                self.parse_nmea(line)
+            n = self.serial.in_waiting
+            if n > 0:
+                # A full buffer without a newline is garbage, start over
+                if self.rxlen == len(self.rxbuf):
+                    self.rxlen = 0
+                
+                # Never ask for more than is waiting, or readinto blocks
+                n = min(n, len(self.rxbuf) - self.rxlen)
+                self.rxlen += self.serial.readinto(self.rxview[self.rxlen:self.rxlen + n])
+                
+                end = self.rxbuf.rfind(b'\n', 0, self.rxlen)
+                if end >= 0:
+                    # Newest complete GGA sentence
+                    gga = self.rxbuf.rfind(b'GGA', 0, end)
+                    if gga >= 0:
+                        start = self.rxbuf.rfind(b'$', 0, gga)
+                        stop = self.rxbuf.find(b'\n', gga, end + 1)
+                        if start >= 0:
+                            self.parse_nmea(self.rxview[start:stop])
+                    
+                    # Keep the trailing partial sentence for the next read
+                    rest = self.rxlen - end - 1
+                    self.rxbuf[:rest] = self.rxbuf[end + 1:self.rxlen]
+                    self.rxlen = rest
         except Exception as e:
             pass
         
@@ -381,6 +494,14 @@ class WebSocketServer:
         self.target = {'pitch': 0.0, 'roll': 0.0, 'yaw': 0.0}
         self.running = True
         
+        # Broadcast payload, reused every tick with its leaf values updated
+        self.payload = {
+            'imu': {'pitch': 0.0, 'roll': 0.0, 'yaw': 0.0, 'heading': 0.0},
+            'gnss': {'latitude': 0.0, 'longitude': 0.0, 'altitude': 0.0},
+            'target': self.target,
+            'corrections': {'x': 0.0, 'y': 0.0, 'z': 0.0}
+        }
+        
     async def initialize(self):
         """Initialize sensors"""
         logger.info("=" * 50)
@@ -427,7 +548,7 @@ class WebSocketServer:
         Expected format: {"command": "SET"}
         """
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             command = data.get('command', '').upper()
             
             if command == 'SET':
@@ -435,12 +556,10 @@ class WebSocketServer:
                 
                 # Set current position as zero reference
                 if self.bno.set_zero():
-                    # Reset target to zero
-                    self.target = {
-                        'pitch': 0.0,
-                        'roll': 0.0,
-                        'yaw': 0.0
-                    }
+                    # Reset target to zero (in place, the payload shares it)
+                    self.target['pitch'] = 0.0
+                    self.target['roll'] = 0.0
+                    self.target['yaw'] = 0.0
                     
                     response = {
                         'status': 'success',
@@ -455,73 +574,107 @@ class WebSocketServer:
                     }
                     logger.error("✗ SET failed")
                 
-                await websocket.send(json.dumps(response))
+                await websocket.send(orjson.dumps(response).decode())
             
             else:
                 logger.warning(f"Unknown command: {command}")
                 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.error("Invalid JSON received from client")
         except Exception as e:
             logger.error(f"Error handling message: {e}")
     
-    async def send_update(self, websocket):
+    def build_update(self):
         """
-        Send complete sensor data update to client
+        Read sensors once and serialize the complete sensor data update
         Format: {imu: {...}, gnss: {...}, target: {...}, corrections: {...}}
         """
+        # Read IMU data from BNO085
+        imu_data = self.bno.read_orientation()
+        
+        # Read GNSS data
+        gnss_data = self.gnss.read_gnss()
+        
+        # Update the payload template in place
+        imu = self.payload['imu']
+        imu['pitch'] = round(imu_data['pitch'], 3)
+        imu['roll'] = round(imu_data['roll'], 3)
+        imu['yaw'] = round(imu_data['yaw'], 3)
+        imu['heading'] = round(imu_data['heading'], 3)
+        
+        gnss = self.payload['gnss']
+        gnss['latitude'] = gnss_data['latitude']
+        gnss['longitude'] = gnss_data['longitude']
+        gnss['altitude'] = gnss_data['altitude']
+        
+        # Calculate corrections (error from target)
+        corrections = self.payload['corrections']
+        corrections['x'] = round(imu_data['roll'] - self.target['roll'], 3)
+        corrections['y'] = round(imu_data['pitch'] - self.target['pitch'], 3)
+        corrections['z'] = round(imu_data['yaw'] - self.target['yaw'], 3)
+        
+        # Decoded so clients keep receiving text frames for JSON.parse
+        return orjson.dumps(self.payload, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    
+    async def send_frame(self, client, frame):
+        """
+        Send one frame to a client without letting a slow peer stall the tick
+        Backed-up or slow clients just miss this tick; they stay connected
+        """
+        transport = getattr(client, 'transport', None)
+        if transport is not None and transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            return
+        
         try:
-            # Read IMU data from BNO085
-            imu_data = self.bno.read_orientation()
-            
-            # Read GNSS data
-            gnss_data = self.gnss.read_gnss()
-            
-            # Calculate corrections (error from target)
-            corrections = {
-                'x': round(imu_data['roll'] - self.target['roll'], 3),
-                'y': round(imu_data['pitch'] - self.target['pitch'], 3),
-                'z': round(imu_data['yaw'] - self.target['yaw'], 3)
-            }
-            
-            # Prepare complete message
-            message = {
-                'imu': imu_data,
-                'gnss': gnss_data,
-                'target': self.target,
-                'corrections': corrections
-            }
-            
-            # Send to client
-            await websocket.send(json.dumps(message))
-            
-        except websockets.exceptions.ConnectionClosed:
+            await asyncio.wait_for(client.send(frame), timeout=SEND_TIMEOUT)
+        except asyncio.TimeoutError:
             pass
-        except Exception as e:
-            logger.error(f"Error sending update: {e}")
     
     async def broadcast_loop(self):
         """
         Continuously broadcast sensor data to all connected clients
         Update rate: 20 Hz (every 50ms)
+        Sensors are read and the message serialized once per tick, then the
+        same frame is sent to every client concurrently.
         """
         logger.info("🔄 Broadcast loop started (20 Hz)")
         
+        interval = 0.05  # 20 Hz = 50ms interval
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        
         while self.running:
             if self.clients:
-                # Send to all connected clients
-                disconnected = set()
-                
-                for client in self.clients:
-                    try:
-                        await self.send_update(client)
-                    except:
-                        disconnected.add(client)
+                try:
+                    frame = self.build_update()
+                except Exception as e:
+                    logger.error(f"Error building update: {e}")
+                    frame = None
                 
-                # Remove disconnected clients
-                self.clients -= disconnected
+                if frame is not None:
+                    # Send to all connected clients
+                    clients = list(self.clients)
+                    results = await asyncio.gather(
+                        *[self.send_frame(client, frame) for client in clients],
+                        return_exceptions=True
+                    )
+                    
+                    # Remove disconnected clients
+                    disconnected = set()
+                    for client, result in zip(clients, results):
+                        if isinstance(result, Exception):
+                            if not isinstance(result, websockets.exceptions.ConnectionClosed):
+                                logger.error(f"Error sending update: {result}")
+                            disconnected.add(client)
+                    self.clients -= disconnected
             
-            await asyncio.sleep(0.05)  # 20 Hz = 50ms interval
+            # Sleep to an absolute deadline so send time does not add drift;
+            # if we fell behind, skip the missed ticks instead of bursting
+            next_tick += interval
+            delay = next_tick - loop.time()
+            if delay < 0:
+                next_tick = loop.time()
+            await asyncio.sleep(max(0.0, delay))
     
     async def start(self):
         """Start WebSocket server"""
@@ -535,7 +688,10 @@ class WebSocketServer:
         logger.info(f"   URL:  ws://{self.host}:{self.port}")
         
         try:
-            async with websockets.serve(self.handle_client, self.host, self.port):
+            # Payloads are ~300 bytes of floats: compressing them costs
+            # more CPU than it saves on the wire
+            async with websockets.serve(self.handle_client, self.host, self.port,
+                                        compression=None):
                 logger.info("✓ Server is running")
                 logger.info("📡 Broadcasting IMU data at 20 Hz")
                 logger.info("Press Ctrl+C to stop")
@@ -544,6 +700,7 @@ class WebSocketServer:
             logger.error(f"Server error: {e}")
         finally:
             self.running = False
+            self.bno.running = False
 
 
 async def main():